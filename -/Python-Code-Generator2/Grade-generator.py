@@ -1,4 +1,7 @@
 import csv
+import os
+
+
 def get_assignment_name():
     while True:
         name = input("Enter Assignment Name: ").strip()
@@ -37,9 +40,103 @@ def get_weight():
             print("Invalid input! Weight must be a number.")
 
 
+class GradeAccumulator:
+    """Running FA/SA totals kept in step with an append-only grades CSV"""
+
+    FIELDS = ["Assignment", "Category", "Grade", "Weight"]
+
+    def __init__(self, path="grades.csv"):
+        self.path = path
+        self.scores = {"FA": 0.0, "SA": 0.0}
+        self.weights = {"FA": 0.0, "SA": 0.0}
+        self.counts = {"FA": 0, "SA": 0}
+        self.count = 0
+        self.has_header = False
+        self._needs_header = True
+        self._needs_newline = False
+        self.load()
+
+    def load(self):
+        """Rebuild the running sums by streaming the existing CSV once"""
+        try:
+            with open(self.path, "r", newline="") as file:
+                for row in csv.reader(file):
+                    if row == self.FIELDS:
+                        self.has_header = True
+                        continue
+                    if len(row) != 4:
+                        continue
+                    try:
+                        grade = float(row[2])
+                        weight = float(row[3])
+                    except ValueError:
+                        continue
+                    category = row[1].strip().upper()
+                    if category in self.scores:
+                        self._apply(category, grade, weight)
+            # Only an empty file gets a header; a hand-edited last line may lack its newline
+            with open(self.path, "rb") as file:
+                file.seek(0, os.SEEK_END)
+                if file.tell():
+                    self._needs_header = False
+                    file.seek(-1, os.SEEK_END)
+                    self._needs_newline = file.read(1) not in (b"\n", b"\r")
+        except FileNotFoundError:
+            pass
+
+    def _apply(self, category, grade, weight):
+        self.scores[category] += (grade / 100) * weight
+        self.weights[category] += weight
+        self.counts[category] += 1
+        self.count += 1
+
+    def add(self, name, category, grade, weight):
+        """Update the sums and append a single row to the CSV"""
+        self._apply(category, grade, weight)
+        with open(self.path, "a", newline="") as file:
+            writer = csv.writer(file)
+            if self._needs_newline:
+                file.write(writer.dialect.lineterminator)
+                self._needs_newline = False
+            if self._needs_header:
+                writer.writerow(self.FIELDS)
+                self._needs_header = False
+                self.has_header = True
+            writer.writerow([name, category, grade, weight])
+
+    def final_grade(self):
+        return self.scores["FA"] + self.scores["SA"]
+
+    def gpa(self):
+        return (self.final_grade() / 100) * 5.0
+
+    def average_weight(self, category):
+        if not self.counts[category]:
+            return 0.0
+        return self.weights[category] / self.counts[category]
+
+    def passed(self, category):
+        return self.scores[category] >= self.weights[category] * 0.5
+
+    def status(self):
+        return "PASS" if self.passed("FA") and self.passed("SA") else "FAIL"
+
+    def required_grade(self, category, weight):
+        """Grade needed on a new assignment of this weight to pass the category.
+
+        Anything above 100 means the category can no longer be passed with
+        a single assignment of that weight.
+        """
+        needed = (self.weights[category] + weight) * 0.5 - self.scores[category]
+        return max(0.0, needed / weight * 100)
+
+
+accumulator = GradeAccumulator("grades.csv")
 assignments = []
 
 print("----- Grade Generator Calculator -----")
+if accumulator.count:
+    print(f"Loaded {accumulator.count} earlier assignment(s) from grades.csv")
 
 while True:
     print("\nEnter Assignment Details:")
@@ -48,6 +145,7 @@ while True:
     grade = get_grade()
     weight = get_weight()
 
+    accumulator.add(name, category, grade, weight)
     assignments.append({
         "Assignment": name,
         "Category": category,
@@ -60,41 +158,35 @@ while True:
         break
 
 # Calculations
-total_FA = sum((a["Grade"] / 100) * a["Weight"] for a in assignments if a["Category"] == "FA")
-total_SA = sum((a["Grade"] / 100) * a["Weight"] for a in assignments if a["Category"] == "SA")
+total_FA = accumulator.scores["FA"]
+total_SA = accumulator.scores["SA"]
+FA_weight_total = accumulator.weights["FA"]
+SA_weight_total = accumulator.weights["SA"]
 
-final_grade = total_FA + total_SA
-gpa = (final_grade / 100) * 5.0
-
-# Pass/Fail Logic
-FA_weight_total = sum(a["Weight"] for a in assignments if a["Category"] == "FA")
-SA_weight_total = sum(a["Weight"] for a in assignments if a["Category"] == "SA")
-
-required_FA = FA_weight_total * 0.5
-required_SA = SA_weight_total * 0.5
-
-passed_FA = total_FA >= required_FA
-passed_SA = total_SA >= required_SA
-
-status = "PASS" if passed_FA and passed_SA else "FAIL"
+final_grade = accumulator.final_grade()
+gpa = accumulator.gpa()
+status = accumulator.status()
 
 # Console Summary
-print("\n------ FINAL SUMMARY ------")
+print(f"\n------ FINAL SUMMARY (all {accumulator.count} assignments in grades.csv) ------")
 print(f"Total Formative Score: {total_FA:.2f} / {FA_weight_total}")
 print(f"Total Summative Score: {total_SA:.2f} / {SA_weight_total}")
 print(f"Final Grade: {final_grade:.2f}%")
 print(f"GPA Equivalent: {gpa:.2f}")
 print(f"Status: {status}")
 
-print("\nAssignments Entered:")
+# What-if: grade needed on one more assignment of the category's average weight
+for category in ["FA", "SA"]:
+    if not accumulator.passed(category) and accumulator.weights[category]:
+        weight = accumulator.average_weight(category)
+        needed = accumulator.required_grade(category, weight)
+        if needed <= 100:
+            print(f"You need {needed:.2f} on a {category} assignment of weight {weight:.2f} to pass {category}.")
+        else:
+            print(f"A single {category} assignment of weight {weight:.2f} is not enough to pass {category}.")
+
+print("\nAssignments Entered This Session:")
 for a in assignments:
     print(f"- {a['Assignment']} ({a['Category']}): Grade={a['Grade']}, Weight={a['Weight']}")
 
-# Generate CSV
-with open("grades.csv", "w", newline="") as file:
-    writer = csv.writer(file)
-    writer.writerow(["Assignment", "Category", "Grade", "Weight"])
-    for a in assignments:
-        writer.writerow([a["Assignment"], a["Category"], a["Grade"], a["Weight"]])
-
-print("\ngrades.csv has been created successfully!")
+print("\ngrades.csv has been updated successfully!")
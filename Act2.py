@@ -1,11 +1,21 @@
-for i in range(1, 11):
-    print(f"student {i}")
-i = 1
-while i <= 10:
-    print(f"student {i}")
-    i = i + 1
-num = int(input("Enter a number: "))
-print(f"Multiplication table for {num}:")
-for i in range(1, 11):
-    print(f"{num} * {i} = {num * i}")
+from buffered_output import BufferedOutput
 
+
+def student_lines(start=1, stop=11):
+    for i in range(start, stop):
+        yield f"student {i}"
+
+
+def multiplication_lines(num, start=1, stop=11):
+    for i in range(start, stop):
+        yield f"{num} * {i} = {num * i}"
+
+
+if __name__ == "__main__":
+    with BufferedOutput() as out:
+        out.write_lines(student_lines(1, 11))
+        out.write_lines(student_lines(1, 11))
+    num = int(input("Enter a number: "))
+    with BufferedOutput() as out:
+        out.write_line(f"Multiplication table for {num}:")
+        out.write_lines(multiplication_lines(num, 1, 11))
@@ -1,66 +1,78 @@
-name = input("What is your name?")
-age = input("How old are you?")
-color = input("What is your favourite color?")
-print(f"your name is {name} your age is {age} years old your favourite color is {color}")
-
-
-num1 = int(input("Enter the first number: "))
-num2 = int(input("Enter the second number: "))
-sum = num1 + num2
-multiplication = num1 * num2
-subtraction = num1 - num2
-division = num1 / num2
-print(f"The sum of {num1} + {num2} = {sum}.")
-print(f"The multiplication of {num1} * {num2} = {multiplication}.")
-print(f"The subtraction of {num1} - {num2} = {subtraction}.")
-print(f"The division of {num1} / {num2} = {division}.")
-
-
-n = int(input("Enter the number: "))
-if n % 2 == 0:
-    print(f"The even number is {n}.")
-else:
-    print(f"The odd number is {n}.")
-print("Numbers from 1 to 20 are:")
-for i in range(1, 20):
-    print(i, end=" ")
-
-print("\nEven numbers from 1 to 20 are:")
-for i in range(1, 21):
-    if i % 2 == 0:
-        print(i, end=" ")
-
-
-favourite_food = []
-print(f"Your 5 favourite foods are:" )
-for i in range(5):
-    favourite_food.append(input())
-print(f"Your favourite foods in reverse order")
-for food in reversed(favourite_food):
-    print(food)
-
-
-food_hate = []
-print(f"The 4 foods you hate are:")
-for i in range(4):
-    food_hate.append(input())
-if food_hate
-    print(f"The food you hate are in reverse order: {food_hate}")
-else food_hate
-    print(f"The food you hate are in reverse order: {food_hate}")
-food_hate = []
-print(f"The 4 foods you hate are:")
-for i in range(4):
-    food_hate.append(input())
-if food_hate
-    print(f"The food you hate are in reverse order: {food_hate}")
-
-
-print("Hello world")
-name = input("What is your name?")
-age = input("How old are you?")
-color = input("What is your favourite color?")
-print(f"Your name is {name}.")
-print(f"Your age is {age}."
+from Functions import arithmetic
+from buffered_output import BufferedOutput
 
 
+def number_lines(start=1, stop=21, step=1):
+    for i in range(start, stop, step):
+        yield i
+
+
+def even_number_lines(start=1, stop=21):
+    first_even = start + start % 2
+    return number_lines(first_even, stop, 2)
+
+
+if __name__ == "__main__":
+    name = input("What is your name?")
+    age = input("How old are you?")
+    color = input("What is your favourite color?")
+    print(f"your name is {name} your age is {age} years old your favourite color is {color}")
+
+
+    num1 = int(input("Enter the first number: "))
+    num2 = int(input("Enter the second number: "))
+    results = arithmetic(num1, num2)
+    sum = results["sum"]
+    multiplication = results["multiplication"]
+    subtraction = results["subtraction"]
+    division = results["division"]
+    print(f"The sum of {num1} + {num2} = {sum}.")
+    print(f"The multiplication of {num1} * {num2} = {multiplication}.")
+    print(f"The subtraction of {num1} - {num2} = {subtraction}.")
+    print(f"The division of {num1} / {num2} = {division}.")
+
+
+    n = int(input("Enter the number: "))
+    if n % 2 == 0:
+        print(f"The even number is {n}.")
+    else:
+        print(f"The odd number is {n}.")
+    with BufferedOutput() as out:
+        out.write_line("Numbers from 1 to 20 are:")
+        out.write_lines(number_lines(1, 20), end=" ")
+
+        out.write_line("\nEven numbers from 1 to 20 are:")
+        out.write_lines(even_number_lines(1, 21), end=" ")
+
+
+    favourite_food = []
+    print(f"Your 5 favourite foods are:" )
+    for i in range(5):
+        favourite_food.append(input())
+    print(f"Your favourite foods in reverse order")
+    for food in reversed(favourite_food):
+        print(food)
+
+
+    food_hate = []
+    print(f"The 4 foods you hate are:")
+    for i in range(4):
+        food_hate.append(input())
+    if food_hate:
+        print(f"The food you hate are in reverse order: {food_hate}")
+    else:
+        print(f"The food you hate are in reverse order: {food_hate}")
+    food_hate = []
+    print(f"The 4 foods you hate are:")
+    for i in range(4):
+        food_hate.append(input())
+    if food_hate:
+        print(f"The food you hate are in reverse order: {food_hate}")
+
+
+    print("Hello world")
+    name = input("What is your name?")
+    age = input("How old are you?")
+    color = input("What is your favourite color?")
+    print(f"Your name is {name}.")
+    print(f"Your age is {age}.")
@@ -1,4 +1,18 @@
+import csv
+import io
+import json
+import math
+import sys
+import time
+from array import array
+from itertools import islice
+from datetime import date as Date, datetime
+
+import numpy as np
+
+
 class Passenger:
+    WEIGHT_LIMIT = 25
     def __init__(self, name, current_location, destination, date):
         self.name = name
         self.current_location = current_location
@@ -7,7 +21,7 @@ class Passenger:
     def get_passenger_info(self):
         return f"Passenger: {self.name}, From: {self.current_location}, To: {self.destination}, Date: {self.date}"
     def get_weight_allowance(self):
-        return " Weight limit: 25 kg"
+        return f" Weight limit: {self.WEIGHT_LIMIT} kg"
 class EconomyPassenger(Passenger):
     pass
 class FirstClassPassenger(Passenger):
@@ -35,12 +49,348 @@ class PremiumClassPassenger(Passenger):
         else:
             return f"{self.name} has no priority boarding"
 
-    eco = EconomyPassenger("Phillip," "Nairobi," "Kigali," "06-11-2025")
-    first = FirstClassPassenger("Davine," "Kigali" "Dubai" "04-05-2025", 25, True)
-    premium = PremiumClassPassenger ("Hassanat," "India" "Delhi" "06-05-2025", 30, True)
+
+# Manifest Store
+class PassengerManifest:
+    """Columnar passenger store indexed by route/date and by class"""
+
+    CLASSES = ("Economy", "First", "Premium")
+    ECONOMY, FIRST, PREMIUM = range(3)
+    DATE_FORMAT = "%d-%m-%Y"
+
+    def __init__(self):
+        # One slot per passenger in each column
+        self.names = []
+        self.origins = array("I")
+        self.destinations = array("I")
+        self.dates = array("I")
+        self.classes = array("B")
+        self.weights = array("d")
+        self.flags = array("B")
+
+        # Interned locations and parsed dates
+        self.location_ids = {}
+        self.location_names = []
+        self._date_ordinals = {}
+        self._date_texts = {}
+
+        # (origin, destination, date) -> class -> row ids, and class -> row ids
+        self.route_index = {}
+        self.class_index = {code: array("I") for code in range(len(self.CLASSES))}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _location_id(self, location):
+        location_id = self.location_ids.get(location)
+        if location_id is None:
+            location_id = len(self.location_names)
+            self.location_ids[location] = location_id
+            self.location_names.append(location)
+        return location_id
+
+    def _class_code(self, passenger_class):
+        try:
+            return self.CLASSES.index(passenger_class)
+        except ValueError:
+            raise ValueError(f"Unknown class {passenger_class!r}, expected one of {self.CLASSES}") from None
+
+    def _date_ordinal(self, date):
+        ordinal = self._date_ordinals.get(date)
+        if ordinal is None:
+            ordinal = datetime.strptime(date, self.DATE_FORMAT).toordinal()
+            self._date_ordinals[date] = ordinal
+        return ordinal
+
+    def date_text(self, ordinal):
+        """Return the normalised DD-MM-YYYY form of a stored date"""
+        text = self._date_texts.get(ordinal)
+        if text is None:
+            text = Date.fromordinal(ordinal).strftime(self.DATE_FORMAT)
+            self._date_texts[ordinal] = text
+        return text
+
+    def add_record(self, name, current_location, destination, date, passenger_class,
+                   weight=0.0, flag=False):
+        """Append one passenger row without building a Passenger object"""
+        # Validate everything before interning, so a bad row leaves no trace
+        class_code = self._class_code(passenger_class)
+        ordinal = self._date_ordinal(date)
+        weight = float(weight)
+        if not math.isfinite(weight):
+            raise ValueError(f"Weight must be a finite number, got {weight!r}")
+        origin_id = self._location_id(current_location)
+        destination_id = self._location_id(destination)
+        row = len(self.names)
+
+        # Either every column gets the row or none does; names go last
+        columns = (self.origins, self.destinations, self.dates,
+                   self.classes, self.weights, self.flags)
+        try:
+            for column, value in zip(columns, (origin_id, destination_id, ordinal,
+                                               class_code, weight, 1 if flag else 0)):
+                column.append(value)
+        except Exception:
+            for column in columns:
+                del column[row:]
+            raise
+        self.names.append(name)
+
+        buckets = self.route_index.get((origin_id, destination_id, ordinal))
+        if buckets is None:
+            buckets = {}
+            self.route_index[(origin_id, destination_id, ordinal)] = buckets
+        bucket = buckets.get(class_code)
+        if bucket is None:
+            bucket = buckets[class_code] = array("I")
+        bucket.append(row)
+        self.class_index[class_code].append(row)
+        return row
+
+    def add(self, passenger):
+        """Append a Passenger (or subclass) instance"""
+        weight = 0.0
+        flag = False
+        if isinstance(passenger, FirstClassPassenger):
+            passenger_class = "First"
+            weight, flag = passenger.weight, passenger.lounge_access
+        elif isinstance(passenger, PremiumClassPassenger):
+            passenger_class = "Premium"
+            weight, flag = passenger.weight, passenger.priority_boarding
+        else:
+            passenger_class = "Economy"
+        return self.add_record(passenger.name, passenger.current_location,
+                               passenger.destination, passenger.date, passenger_class,
+                               weight, flag)
+
+    def extend(self, passengers):
+        for passenger in passengers:
+            self.add(passenger)
+
+    def find(self, current_location, destination, date, passenger_class=None):
+        """Row ids on a route and date, optionally for a single class"""
+        origin_id = self.location_ids.get(current_location)
+        destination_id = self.location_ids.get(destination)
+        if origin_id is None or destination_id is None:
+            return []
+        # Parse without caching so lookups never grow the store
+        ordinal = self._date_ordinals.get(date)
+        if ordinal is None:
+            try:
+                ordinal = datetime.strptime(date, self.DATE_FORMAT).toordinal()
+            except ValueError:
+                return []
+        buckets = self.route_index.get((origin_id, destination_id, ordinal))
+        if not buckets:
+            return []
+        if passenger_class is not None:
+            return list(buckets.get(self._class_code(passenger_class), ()))
+        rows = []
+        for bucket in buckets.values():
+            rows.extend(bucket)
+        rows.sort()
+        return rows
+
+    def by_class(self, passenger_class):
+        """Row ids of every passenger in a class"""
+        return list(self.class_index[self._class_code(passenger_class)])
+
+    def passenger(self, row):
+        """Rebuild the Passenger object stored at a row"""
+        args = (self.names[row],
+                self.location_names[self.origins[row]],
+                self.location_names[self.destinations[row]],
+                self.date_text(self.dates[row]))
+        class_code = self.classes[row]
+        if class_code == self.FIRST:
+            return FirstClassPassenger(*args, self.weights[row], bool(self.flags[row]))
+        if class_code == self.PREMIUM:
+            return PremiumClassPassenger(*args, self.weights[row], bool(self.flags[row]))
+        return EconomyPassenger(*args)
+
+
+# Flight Aggregation
+class FlightAggregator:
+    """Baggage, lounge and boarding totals per route and date, computed with NumPy"""
+
+    @staticmethod
+    def _columns(manifest):
+        """NumPy copies of the manifest columns, so the manifest can keep growing"""
+        def unsigned(column):
+            return np.array(column, dtype=f"u{column.itemsize}")
+        return {
+            "origins": unsigned(manifest.origins),
+            "destinations": unsigned(manifest.destinations),
+            "dates": unsigned(manifest.dates),
+            "classes": unsigned(manifest.classes),
+            "weights": np.array(manifest.weights, dtype=np.float64),
+            "flags": unsigned(manifest.flags),
+        }
+
+    @staticmethod
+    def summarize(passengers, weight_limit=Passenger.WEIGHT_LIMIT):
+        """Return {(from, to, date): totals} for a manifest or a batch of passengers"""
+        if isinstance(passengers, PassengerManifest):
+            manifest = passengers
+        else:
+            manifest = PassengerManifest()
+            manifest.extend(passengers)
+        if not len(manifest):
+            return {}
+
+        cols = FlightAggregator._columns(manifest)
+        location_count = len(manifest.location_names)
+        first_date = int(cols["dates"].min())
+        route = cols["origins"].astype(np.int64) * location_count + cols["destinations"]
+        keys = route * (int(cols["dates"].max()) - first_date + 1) + (cols["dates"] - first_date)
+        flight_keys, flight_of_row = np.unique(keys, return_inverse=True)
+        flight_count = len(flight_keys)
+
+        weights = cols["weights"]
+        flagged = cols["flags"].astype(bool)
+        lounge = flagged & (cols["classes"] == PassengerManifest.FIRST)
+        priority = flagged & (cols["classes"] == PassengerManifest.PREMIUM)
+
+        passengers_per_flight = np.bincount(flight_of_row, minlength=flight_count)
+        total_weight = np.bincount(flight_of_row, weights, flight_count)
+        over_limit = np.bincount(flight_of_row, np.maximum(weights - weight_limit, 0.0), flight_count)
+        over_limit_count = np.bincount(flight_of_row, weights > weight_limit, flight_count)
+        lounge_count = np.bincount(flight_of_row, lounge, flight_count)
+
+        # Priority queues keep manifest order within each flight
+        priority_rows = np.flatnonzero(priority)
+        priority_flights = flight_of_row[priority_rows]
+        order = np.argsort(priority_flights, kind="stable")
+        queue_sizes = np.bincount(priority_flights, minlength=flight_count)
+        queues = np.split(priority_rows[order], np.cumsum(queue_sizes)[:-1])
+
+        first_rows = np.zeros(flight_count, dtype=np.int64)
+        first_rows[flight_of_row[::-1]] = np.arange(len(manifest) - 1, -1, -1)
+
+        summary = {}
+        for flight in range(flight_count):
+            row = first_rows[flight]
+            key = (manifest.location_names[cols["origins"][row]],
+                   manifest.location_names[cols["destinations"][row]],
+                   manifest.date_text(int(cols["dates"][row])))
+            summary[key] = {
+                "passengers": int(passengers_per_flight[flight]),
+                "total_weight": float(total_weight[flight]),
+                "over_limit_weight": float(over_limit[flight]),
+                "over_limit_passengers": int(over_limit_count[flight]),
+                "lounge_access": int(lounge_count[flight]),
+                "priority_boarding": queues[flight].tolist(),
+            }
+        return summary
+
+
+# Manifest Export
+class ManifestWriter:
+    """Streams manifest rows as text, CSV or JSONL in large batched writes.
+
+    Dates are written in the normalised DD-MM-YYYY form, so a row entered as
+    4-5-2025 is exported as 04-05-2025.
+    """
+
+    FORMATS = ("text", "csv", "jsonl")
+    CSV_FIELDS = ["Passenger", "From", "To", "Date", "Class", "Weight"]
+
+    def __init__(self, manifest, fmt="text", batch_size=10000):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unknown format {fmt!r}, expected one of {self.FORMATS}")
+        self.manifest = manifest
+        self.fmt = fmt
+        self.batch_size = batch_size
+        self._fragments = {}
+
+    def _fragment(self, row):
+        """Route/date part of a row, rendered once per flight"""
+        m = self.manifest
+        key = (m.origins[row], m.destinations[row], m.dates[row])
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            origin = m.location_names[key[0]]
+            destination = m.location_names[key[1]]
+            date = m.date_text(key[2])
+            if self.fmt == "text":
+                fragment = f", From: {origin}, To: {destination}, Date: {date}\n"
+            else:
+                fragment = (f', "from": {json.dumps(origin)}, "to": {json.dumps(destination)}, '
+                            f'"date": {json.dumps(date)}')
+            self._fragments[key] = fragment
+        return fragment
+
+    def batches(self, rows=None):
+        """Yield the rendered output one batch at a time"""
+        m = self.manifest
+        rows = iter(range(len(m)) if rows is None else rows)
+        # One buffer per call, reused from batch to batch
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if self.fmt == "csv":
+            writer.writerow(self.CSV_FIELDS)
+
+        while True:
+            batch = list(islice(rows, self.batch_size))
+            if not batch:
+                if buffer.tell():
+                    yield buffer.getvalue(), 0
+                    buffer.seek(0)
+                    buffer.truncate()
+                break
+            if self.fmt == "text":
+                buffer.write("".join(["Passenger: " + m.names[row] + self._fragment(row)
+                                      for row in batch]))
+            elif self.fmt == "csv":
+                names, classes, weights = m.names, m.classes, m.weights
+                locations, date_text = m.location_names, m.date_text
+                writer.writerows([(names[row], locations[m.origins[row]],
+                                   locations[m.destinations[row]], date_text(m.dates[row]),
+                                   m.CLASSES[classes[row]], weights[row]) for row in batch])
+            else:
+                buffer.write("".join(['{"passenger": ' + json.dumps(m.names[row])
+                                      + self._fragment(row)
+                                      + ', "class": "' + m.CLASSES[m.classes[row]]
+                                      + '", "weight": ' + json.dumps(m.weights[row]) + '}\n'
+                                      for row in batch]))
+            yield buffer.getvalue(), len(batch)
+            buffer.seek(0)
+            buffer.truncate()
+
+    def write(self, out=None, rows=None):
+        """Write rows to a path, an open file or stdout and report throughput"""
+        if isinstance(out, str):
+            with open(out, "w", newline="") as f:
+                return self.write(f, rows)
+        out = sys.stdout if out is None else out
+
+        count = 0
+        started = time.perf_counter()
+        for chunk, size in self.batches(rows):
+            out.write(chunk)
+            count += size
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": count,
+            "seconds": elapsed,
+            "rows_per_second": count / elapsed if elapsed else float("inf"),
+        }
+
+
+if __name__ == "__main__":
+    eco = EconomyPassenger("Phillip", "Nairobi", "Kigali", "06-11-2025")
+    first = FirstClassPassenger("Davine", "Kigali", "Dubai", "04-05-2025", 25, True)
+    premium = PremiumClassPassenger("Hassanat", "India", "Delhi", "06-05-2025", 30, True)
     print(eco.get_passenger_info())
     print(eco.get_weight_allowance())
     print(first.get_passenger_info())
-    print(first.access_lounge())
     print(premium.get_passenger_info())
-    print(premium.get_priority_boadring())
+
+    manifest = PassengerManifest()
+    manifest.extend([eco, first, premium])
+    for row in manifest.find("Kigali", "Dubai", "04-05-2025", "First"):
+        print(manifest.passenger(row).get_passenger_info())
+    for flight, totals in FlightAggregator.summarize(manifest).items():
+        print(flight, totals)
+    stats = ManifestWriter(manifest, "csv").write()
+    print(f"Wrote {stats['rows']} rows at {stats['rows_per_second']:.0f} rows/s")
@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+
+from Functions import add, arithmetic, check_even_odd, divide, find_largest, multiply, subtract, top_k
+
+
+def scalar_loop(a, b, c):
+    # The scalar functions called once per number, as the scripts do
+    # (parity is inlined because the scalar check_even_odd prints)
+    results = []
+    for x, y, z in zip(a, b, c):
+        results.append((
+            add(x, y),
+            multiply(x, y),
+            subtract(x, y),
+            divide(x, y) if y != 0 else float("nan"),
+            "Even" if x % 2 == 0 else "Odd",
+            find_largest(x, y, z),
+        ))
+    return results
+
+
+def vectorized(a, b, c):
+    return (
+        arithmetic(a, b),
+        check_even_odd(a),
+        find_largest(a, b, c),
+        top_k(np.column_stack((a, b, c)), 2),
+    )
+
+
+def timed(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for n in (10_000, 100_000, 1_000_000):
+        a, b, c = (rng.integers(-1000, 1000, n) for _ in range(3))
+        scalar_time = timed(scalar_loop, a.tolist(), b.tolist(), c.tolist())
+        vector_time = timed(vectorized, a, b, c)
+        print(f"n={n:>9,}: scalar {scalar_time:.3f}s  vectorized {vector_time:.3f}s  "
+              f"speedup {scalar_time / vector_time:.1f}x")
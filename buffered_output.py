@@ -0,0 +1,55 @@
+import sys
+from itertools import islice
+
+
+class BufferedOutput:
+    """Collects lines in memory and writes them out in large chunks"""
+
+    def __init__(self, target=None, chunk_size=1 << 16, batch_lines=4096):
+        # target can be None (stdout), a file path or an open text file
+        self._owns_file = isinstance(target, str)
+        if self._owns_file:
+            self.file = open(target, "w")
+        else:
+            self.file = sys.stdout if target is None else target
+        self.chunk_size = chunk_size
+        self.batch_lines = batch_lines
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        """Buffer raw text, flushing once the chunk size is reached"""
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self.flush()
+
+    def write_line(self, line, end="\n"):
+        self.write(f"{line}{end}")
+
+    def write_lines(self, lines, end="\n"):
+        """Buffer every line from an iterable or generator, batch by batch"""
+        lines = iter(lines)
+        while True:
+            batch = list(islice(lines, self.batch_lines))
+            if not batch:
+                break
+            self.write(end.join(map(str, batch)) + end)
+
+    def flush(self):
+        if self._parts:
+            self.file.write("".join(self._parts))
+            self._parts = []
+            self._size = 0
+        self.file.flush()
+
+    def close(self):
+        self.flush()
+        if self._owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -18,26 +18,67 @@ class User:
         self.sent_requests = []
         self.created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
+    def __setattr__(self, name, value):
+        """Drop cached render blocks whenever a field is reassigned"""
+        object.__setattr__(self, name, value)
+        if name != "_render_cache":
+            object.__setattr__(self, "_render_cache", {})
+
+    def _cached(self, key, build):
+        """Return a cached render block, building it on first use"""
+        cache = self.__dict__.setdefault("_render_cache", {})
+        block = cache.get(key)
+        if block is None:
+            block = cache[key] = build()
+        return block
+
+    def profile_lines(self):
+        """Lines shown by display_profile; subclasses extend this"""
+        return [
+            f"\nName: {self.name}",
+            f"Username: @{self.username}",
+            f"Role: {self.role}",
+            f"Industry: {self.industry}",
+            f"Bio: {self.bio}",
+        ]
+
+    def profile_block(self):
+        return self._cached("profile", lambda: "\n".join(self.profile_lines()))
+
+    def summary_block(self):
+        """Name and Role | Industry lines used by the listing screens"""
+        return self._cached("summary", lambda: (
+            f"{self.name} (@{self.username})\n"
+            f"   Role: {self.role} | Industry: {self.industry}\n"
+            + "-" * 40
+        ))
+
+    def dashboard_block(self):
+        # Counts come from lists mutated in place, so they are part of the key
+        counts = (len(self.connections), len(self.pending_requests))
+        cached = self._render_cache.get("dashboard")
+        if cached is None or cached[0] != counts:
+            header = self._cached("dashboard_header", lambda: "\n".join([
+                "\n" + "=" * 60,
+                f"{'DASHBOARD - ' + self.name:^60}",
+                "=" * 60,
+                f"Username: {self.username}",
+                f"Role: {self.role}",
+                f"Industry: {self.industry}",
+                f"Bio: {self.bio}",
+            ]))
+            cached = (counts, f"{header}\nConnections: {counts[0]}\n"
+                              f"Pending Requests: {counts[1]}\n" + "=" * 60)
+            self._render_cache["dashboard"] = cached
+        return cached[1]
+
     def view_dashboard(self):
         """Display user's dashboard with profile info and connections"""
-        print("\n" + "=" * 60)
-        print(f"{'DASHBOARD - ' + self.name:^60}")
-        print("=" * 60)
-        print(f"Username: {self.username}")
-        print(f"Role: {self.role}")
-        print(f"Industry: {self.industry}")
-        print(f"Bio: {self.bio}")
-        print(f"Connections: {len(self.connections)}")
-        print(f"Pending Requests: {len(self.pending_requests)}")
-        print("=" * 60)
+        print(self.dashboard_block())
 
     def display_profile(self):
         """Display basic profile information"""
-        print(f"\nName: {self.name}")
-        print(f"Username: @{self.username}")
-        print(f"Role: {self.role}")
-        print(f"Industry: {self.industry}")
-        print(f"Bio: {self.bio}")
+        print(self.profile_block())
 
     def send_connection_request(self, target_user):
         """Send a connection request to another user"""
@@ -131,12 +172,13 @@ class StartupFounder(User):
         self.duration = duration
         self.scale = scale
 
-    def display_profile(self):
+    def profile_lines(self):
         """Override to show startup-specific details"""
-        super().display_profile()
-        print(f"Startup Name: {self.startup_name}")
-        print(f"Operating Duration: {self.duration}")
-        print(f"Scale: {self.scale}")
+        return super().profile_lines() + [
+            f"Startup Name: {self.startup_name}",
+            f"Operating Duration: {self.duration}",
+            f"Scale: {self.scale}",
+        ]
 
     def view_matches(self, all_users):
         """Founders match with Mentors and Investors"""
@@ -171,11 +213,12 @@ class Mentor(User):
         self.expertise = expertise
         self.years_experience = years_experience
 
-    def display_profile(self):
+    def profile_lines(self):
         """Override to show mentor-specific details"""
-        super().display_profile()
-        print(f"Expertise: {self.expertise}")
-        print(f"Years of Experience: {self.years_experience}")
+        return super().profile_lines() + [
+            f"Expertise: {self.expertise}",
+            f"Years of Experience: {self.years_experience}",
+        ]
 
     def view_matches(self, all_users):
         """Mentors match with Startup Founders"""
@@ -208,11 +251,12 @@ class Investor(User):
         self.investment_range = investment_range
         self.investment_stage = investment_stage
 
-    def display_profile(self):
+    def profile_lines(self):
         """Override to show investor-specific details"""
-        super().display_profile()
-        print(f"Investment Range: {self.investment_range}")
-        print(f"Investment Stage: {self.investment_stage}")
+        return super().profile_lines() + [
+            f"Investment Range: {self.investment_range}",
+            f"Investment Stage: {self.investment_stage}",
+        ]
 
     def view_matches(self, all_users):
         """Investors match with Startup Founders"""
@@ -313,6 +357,7 @@ class StartupConnect:
 
     def __init__(self):
         self.users = DataManager.load_users()
+        self.users_by_username = {user.username: user for user in self.users}
         self.current_user = None
 
     def run(self):
@@ -366,7 +411,7 @@ class StartupConnect:
         username = input("\nEnter username: ").strip()
 
         # Check if username already exists
-        if any(user.username == username for user in self.users):
+        if username in self.users_by_username:
             print("Username already exists. Please choose another.")
             return
 
@@ -395,6 +440,7 @@ class StartupConnect:
             user = Investor(username, name, industry, bio, inv_range, inv_stage)
 
         self.users.append(user)
+        self.users_by_username[user.username] = user
         DataManager.save_users(self.users)
 
         print(f"\n✓ Registration successful! Welcome, {name}!")
@@ -408,7 +454,7 @@ class StartupConnect:
 
         username = input("\nEnter username: ").strip()
 
-        user = next((u for u in self.users if u.username == username), None)
+        user = self.users_by_username.get(username)
 
         if user:
             self.current_user = user
@@ -454,12 +500,10 @@ class StartupConnect:
             print("\nNo matches found in your industry.")
             return
 
+        divider = "-" * 40
         print(f"\nFound {len(matches)} match(es):\n")
-
-        for idx, user in enumerate(matches, 1):
-            print(f"{idx}. ", end="")
-            user.display_profile()
-            print("-" * 40)
+        print("\n".join(f"{idx}. {user.profile_block()}\n{divider}"
+                        for idx, user in enumerate(matches, 1)))
 
         # Option to send connection request
         choice = input("\nEnter number to send connection request (or 0 to go back): ").strip()
@@ -490,12 +534,13 @@ class StartupConnect:
 
         print(f"\nYou have {len(self.current_user.pending_requests)} pending request(s):\n")
 
+        entries = []
         for idx, username in enumerate(self.current_user.pending_requests, 1):
-            user = next((u for u in self.users if u.username == username), None)
+            user = self.users_by_username.get(username)
             if user:
-                print(f"{idx}. Request from {user.name} (@{user.username})")
-                print(f"   Role: {user.role} | Industry: {user.industry}")
-                print("-" * 40)
+                entries.append(f"{idx}. Request from {user.summary_block()}")
+        if entries:
+            print("\n".join(entries))
 
         # Option to respond to request
         choice = input("\nEnter number to respond to request (or 0 to go back): ").strip()
@@ -536,12 +581,13 @@ class StartupConnect:
 
         print(f"\nYou are connected with {len(self.current_user.connections)} user(s):\n")
 
+        entries = []
         for idx, username in enumerate(self.current_user.connections, 1):
-            user = next((u for u in self.users if u.username == username), None)
+            user = self.users_by_username.get(username)
             if user:
-                print(f"{idx}. {user.name} (@{user.username})")
-                print(f"   Role: {user.role} | Industry: {user.industry}")
-                print("-" * 40)
+                entries.append(f"{idx}. {user.summary_block()}")
+        if entries:
+            print("\n".join(entries))
 
     def logout(self):
         """Logout current user"""
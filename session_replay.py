@@ -0,0 +1,247 @@
+import argparse
+import builtins
+import contextlib
+import io
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Script entry points are run as __main__; StartupConnect is driven through its class
+SCRIPTS = {
+    "grade_generator": os.path.join(HERE, "-", "Python-Code-Generator2", "Grade-generator.py"),
+    "functions": os.path.join(HERE, "Functions.py"),
+    "activity": os.path.join(HERE, "Activity.py"),
+    "act2": os.path.join(HERE, "Act2.py"),
+}
+ENTRY_POINTS = ["startup_connect"] + list(SCRIPTS)
+
+
+class ScriptExhausted(EOFError):
+    """Raised when a replayed program asks for more input than the script has"""
+
+
+class ScriptedInput:
+    """Stand-in for input() that replays answers and times every step"""
+
+    def __init__(self, answers):
+        self.answers = iter(answers)
+        self.latencies = []
+        self._last = time.perf_counter()
+
+    def __call__(self, prompt=""):
+        # Time from the previous answer until the program asked again
+        self.latencies.append(time.perf_counter() - self._last)
+        try:
+            answer = next(self.answers)
+        except StopIteration:
+            raise ScriptExhausted(prompt) from None
+        self._last = time.perf_counter()
+        return answer
+
+    def finish(self):
+        """Record the time spent after the last answer"""
+        self.latencies.append(time.perf_counter() - self._last)
+
+
+class _NullWriter(io.TextIOBase):
+    """Discards program output so replays are not bound by the terminal"""
+
+    def write(self, text):
+        return len(text)
+
+
+def _run_entry(entry):
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    if entry == "startup_connect":
+        from new import StartupConnect
+        StartupConnect().run()
+    else:
+        runpy.run_path(SCRIPTS[entry], run_name="__main__")
+
+
+def run_session(entry, answers, capture=False, seed_dir=None):
+    """Run one entry point against scripted answers in a fresh data directory.
+
+    The directory starts empty, or as a copy of seed_dir, so every session
+    sees the same data files no matter which sessions ran before it.
+    """
+    if entry not in ENTRY_POINTS:
+        raise ValueError(f"Unknown entry point {entry!r}, expected one of {ENTRY_POINTS}")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="replay-") as data_dir:
+        if seed_dir is not None:
+            shutil.copytree(seed_dir, data_dir, dirs_exist_ok=True)
+        os.chdir(data_dir)
+
+        scripted = ScriptedInput(answers)
+        out = io.StringIO() if capture else _NullWriter()
+        outcome = "completed"
+        original_input = builtins.input
+        builtins.input = scripted
+        started = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(out):
+                _run_entry(entry)
+        except ScriptExhausted:
+            outcome = "exhausted"
+        except SystemExit:
+            outcome = "exit"
+        except Exception as e:
+            outcome = f"error: {type(e).__name__}: {e}"
+        finally:
+            builtins.input = original_input
+            os.chdir(cwd)
+        scripted.finish()
+        seconds = time.perf_counter() - started
+
+    return {
+        "entry": entry,
+        "outcome": outcome,
+        "steps": len(scripted.latencies),
+        "latencies": scripted.latencies,
+        "seconds": seconds,
+        "transcript": out.getvalue() if capture else None,
+    }
+
+
+def _run_session_args(session, seed_dir=None):
+    entry, answers = session
+    return run_session(entry, answers, seed_dir=seed_dir)
+
+
+def build_seed(sessions, seed_dir):
+    """Run sessions one after another in seed_dir, leaving their data files behind"""
+    cwd = os.getcwd()
+    os.chdir(seed_dir)
+    original_input = builtins.input
+    try:
+        for entry, answers in sessions:
+            builtins.input = ScriptedInput(answers)
+            try:
+                with contextlib.redirect_stdout(_NullWriter()):
+                    _run_entry(entry)
+            except (ScriptExhausted, SystemExit):
+                pass
+    finally:
+        builtins.input = original_input
+        os.chdir(cwd)
+
+
+def replay(sessions, workers=None, chunksize=16, seed_dir=None):
+    """Replay (entry, answers) sessions, each against a fresh copy of seed_dir"""
+    sessions = list(sessions)
+    run = partial(_run_session_args, seed_dir=seed_dir)
+    started = time.perf_counter()
+    if workers == 0:
+        results = [run(session) for session in sessions]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run, sessions, chunksize=chunksize))
+    return results, time.perf_counter() - started
+
+
+def _percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def summarize(results, elapsed):
+    """Throughput and step latency percentiles for a replay run"""
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    steps = len(latencies)
+    return {
+        "sessions": len(results),
+        "steps": steps,
+        "seconds": elapsed,
+        "sessions_per_second": len(results) / elapsed if elapsed else 0.0,
+        "steps_per_second": steps / elapsed if elapsed else 0.0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else 0.0) * 1000,
+        "outcomes": Counter(result["outcome"] for result in results),
+    }
+
+
+# Scripted Sessions
+INDUSTRIES = ["FinTech", "HealthTech", "EdTech", "AgriTech"]
+
+
+def startup_connect_session(i):
+    """Register a user, log in, browse every screen, log out and exit"""
+    role = str(i % 3 + 1)
+    answers = ["1", role, f"user{i}", f"User {i}", INDUSTRIES[i % len(INDUSTRIES)], f"Bio of user {i}"]
+    if role == "1":
+        answers += [f"Startup {i}", "2 years", "Early Stage"]
+    elif role == "2":
+        answers += ["Product Development", "5"]
+    else:
+        answers += ["$10K-$50K", "Seed"]
+    # "0" backs out of the match list, or is rejected by the menu if there were no matches
+    answers += ["2", f"user{i}", "1", "2", "0", "3", "4", "5", "3"]
+    return "startup_connect", answers
+
+
+def grade_generator_session(i):
+    return "grade_generator", [f"FA {i}", "FA", str(50 + i % 50), "10", "y",
+                               f"SA {i}", "SA", str(40 + i % 60), "20", "n"]
+
+
+def functions_session(i):
+    return "functions", [str(i), str(i + 1), str(i)]
+
+
+def act2_session(i):
+    return "act2", [str(i % 12 + 1)]
+
+
+def activity_session(i):
+    return "activity", ([f"Name {i}", "20", "blue", str(i), str(i % 9 + 1), str(i)]
+                        + [f"food {n}" for n in range(5)]
+                        + [f"hated {n}" for n in range(8)]
+                        + [f"Name {i}", "20", "blue"])
+
+
+SESSION_BUILDERS = {
+    "startup_connect": startup_connect_session,
+    "grade_generator": grade_generator_session,
+    "functions": functions_session,
+    "activity": activity_session,
+    "act2": act2_session,
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay scripted sessions against the interactive programs")
+    parser.add_argument("entry", choices=ENTRY_POINTS + ["all"])
+    parser.add_argument("sessions", type=int, nargs="?", default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="0 runs sessions in this process")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="sessions replayed once up front to build the data every session starts from")
+    args = parser.parse_args()
+
+    entries = ENTRY_POINTS if args.entry == "all" else [args.entry]
+    for entry in entries:
+        build = SESSION_BUILDERS[entry]
+        with tempfile.TemporaryDirectory(prefix="replay-seed-") as seed_dir:
+            # Seed sessions use indices after the measured ones so usernames never clash
+            build_seed((build(args.sessions + i) for i in range(args.seed)), seed_dir)
+            results, elapsed = replay((build(i) for i in range(args.sessions)),
+                                      workers=args.workers, seed_dir=seed_dir)
+        stats = summarize(results, elapsed)
+        print(f"{entry}: {stats['sessions']} sessions, {stats['steps']} steps in {stats['seconds']:.2f}s "
+              f"({stats['sessions_per_second']:.0f} sessions/s, {stats['steps_per_second']:.0f} steps/s)")
+        print(f"  step latency p50={stats['p50_ms']:.3f}ms p95={stats['p95_ms']:.3f}ms "
+              f"p99={stats['p99_ms']:.3f}ms max={stats['max_ms']:.3f}ms")
+        print(f"  outcomes: {dict(stats['outcomes'])}")